@@ -5,7 +5,7 @@ and framework meta-affairs (AffairMain, CallbackErrorAffair, etc.).
 """
 
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, Self
 
 from pydantic import BaseModel, ConfigDict, ValidationError
 
@@ -41,12 +41,33 @@ class MutableAffair(BaseModel):
     merge_strategy: MergeStrategy = "raise"
 
     def __init__(self, **data: Any) -> None:
-        """Wrap pydantic ValidationError into AffairValidationError."""
+        """Wrap pydantic ValidationError into AffairValidationError.
+
+        Validates straight through the class's compiled pydantic-core
+        validator, skipping the ``BaseModel.__init__`` wrapper frame.
+        """
         try:
-            super().__init__(**data)
+            self.__pydantic_validator__.validate_python(data, self_instance=self)
         except ValidationError as exc:
             raise AffairValidationError(str(exc)) from exc
 
+    @classmethod
+    def _unchecked(cls, **data: Any) -> Self:
+        """Build an instance from trusted data without running validation.
+
+        Reserved for framework-internal construction (e.g. meta-affairs
+        built by dispatchers from strings the framework produced itself).
+        Callers must pass complete, correctly typed fields; nothing is
+        checked.  User code should use the regular constructor.
+
+        Args:
+            **data: Field values.
+
+        Returns:
+            Unvalidated instance of ``cls``.
+        """
+        return cls.model_construct(**data)
+
 
 class Affair(MutableAffair):
     """Base class for all affairs.
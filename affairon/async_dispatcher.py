@@ -6,7 +6,7 @@ from loguru import logger
 from affairon._types import AsyncCallback
 from affairon.affairs import CallbackErrorAffair, MutableAffair
 from affairon.base_dispatcher import BaseDispatcher
-from affairon.utils import callable_name, merge_dict
+from affairon.utils import MERGERS
 
 log = logger.bind(source=__name__)
 
@@ -17,14 +17,17 @@ class AsyncDispatcher(BaseDispatcher[AsyncCallback]):
     Executes listeners asynchronously with same-priority parallelism.
     Uses asyncio.TaskGroup for structured concurrency.
     Recursive emit() calls execute directly (no queue).
-    """
-
-    @staticmethod
-    async def _sample_guardian(affair: MutableAffair) -> None:
-        """Silent guardian callback to anchor execution order."""
 
-    def __init__(self):
-        super().__init__(self._sample_guardian)
+    Note:
+        Every listener runs in its own task, so ``ContextVar`` changes it
+        makes stay isolated from the emitter and from other listeners.
+        Layers with a single firing listener await that task directly,
+        without a TaskGroup.  Do not install ``asyncio.eager_task_factory`` on the
+        loop running this dispatcher: on Python 3.12 an eagerly failing
+        task cancels the group before sibling tasks are created, so the
+        remaining ``create_task`` calls raise ``RuntimeError`` instead of
+        being grouped into the ``ExceptionGroup``.
+    """
 
     async def emit(self, affair: MutableAffair) -> dict[str, Any]:
         """Asynchronously dispatch affair.
@@ -35,7 +38,8 @@ class AsyncDispatcher(BaseDispatcher[AsyncCallback]):
 
         If a callback raises an exception, the dispatcher emits a
         :class:`CallbackErrorAffair`.  Error handlers may return control
-        keys (``retry``, ``deadletter``, ``silent``) to influence recovery.
+        keys (``retry``, ``retry_backoff``, ``deadletter``, ``silent``) to
+        influence recovery.
         Priority: retry first → deadletter → silent → re-raise.
 
         Warning:
@@ -60,48 +64,82 @@ class AsyncDispatcher(BaseDispatcher[AsyncCallback]):
             RecursionError: If listeners form infinite recursion chain.
             ExceptionGroup: If multiple listeners fail simultaneously.
         """
-        strategy = affair.merge_strategy
+        layers = self._plan_for(affair)
+        if not layers:
+            return {}
+        merge = MERGERS[affair.merge_strategy]
         merged_result: dict[str, Any] = {}
-        affair_types = self._resolve_affair_types(affair)
-        log.debug(
-            "Emit {} (types={})",
-            type(affair).__qualname__,
-            [t.__qualname__ for t in affair_types],
-        )
-        for affair_type in affair_types:
-            layers = self._registry.exec_order(affair_type)
-            for layer in layers:
-                tasks: list[asyncio.Task[dict[str, Any] | None]] = []
-                filtered_cbs: list[AsyncCallback] = []
+        for layer in layers:
+            fired = [
+                (callback, name)
+                for callback, name, when in layer
+                if when is None or when(affair)
+            ]
+            if not fired:
+                continue
+            outcomes: list[tuple[str, dict[str, Any] | None]]
+            if len(fired) == 1:
+                # A lone callback has nothing to run concurrently with, so
+                # await its task directly instead of paying for a TaskGroup.
+                callback, name = fired[0]
+                outcomes = [(name, await self._invoke_inline(callback, name, affair))]
+            else:
                 async with asyncio.TaskGroup() as group:
-                    for callback in layer:
-                        if not self._registry.should_fire(
-                            callback, affair_type, affair
-                        ):
-                            continue
-                        filtered_cbs.append(callback)
-                        tasks.append(
-                            group.create_task(self._invoke_or_handle(callback, affair))
+                    pending = [
+                        (
+                            name,
+                            group.create_task(
+                                self._invoke_or_handle(callback, name, affair)
+                            ),
                         )
-                for cb, task in zip(filtered_cbs, tasks, strict=True):
-                    result = task.result()
-                    if result is not None:
-                        if not isinstance(result, dict):
-                            raise TypeError(
-                                f"Callback {callable_name(cb)} returned "
-                                f"{type(result).__name__}, expected dict or None"
-                            )
-                        merge_dict(
-                            merged_result,
-                            result,
-                            strategy=strategy,
-                            source_name=callable_name(cb),
+                        for callback, name in fired
+                    ]
+                outcomes = [(name, task.result()) for name, task in pending]
+            for name, result in outcomes:
+                if result is not None:
+                    if not isinstance(result, dict):
+                        raise TypeError(
+                            f"Callback {name} returned "
+                            f"{type(result).__name__}, expected dict or None"
                         )
+                    merge(merged_result, result, name)
         return merged_result
 
+    async def _invoke_inline(
+        self,
+        callback: AsyncCallback,
+        name: str,
+        affair: MutableAffair,
+    ) -> dict[str, Any] | None:
+        """Invoke a lone callback without a TaskGroup.
+
+        The callback still runs in its own task, on a copy of the current
+        context, so ``ContextVar`` isolation matches multi-callback layers.
+        Unhandled failures are wrapped in an :class:`ExceptionGroup` so
+        callers see the same exception shape as for multi-callback layers.
+
+        Args:
+            callback: The async callback to invoke.
+            name: Display name of *callback*.
+            affair: The affair being dispatched.
+
+        Returns:
+            Callback result, or None if error was silenced/dead-lettered.
+
+        Raises:
+            ExceptionGroup: If no error handler suppresses the failure.
+        """
+        try:
+            return await asyncio.create_task(
+                self._invoke_or_handle(callback, name, affair)
+            )
+        except Exception as exc:
+            raise ExceptionGroup("unhandled errors in affair dispatch", [exc]) from None
+
     async def _invoke_or_handle(
         self,
         callback: AsyncCallback,
+        name: str,
         affair: MutableAffair,
     ) -> dict[str, Any] | None:
         """Invoke a callback, routing exceptions to error handling.
@@ -111,6 +149,7 @@ class AsyncDispatcher(BaseDispatcher[AsyncCallback]):
 
         Args:
             callback: The async callback to invoke.
+            name: Display name of *callback*.
             affair: The affair being dispatched.
 
         Returns:
@@ -122,19 +161,22 @@ class AsyncDispatcher(BaseDispatcher[AsyncCallback]):
         try:
             return await callback(affair)
         except Exception as exc:
-            return await self._handle_callback_error(callback, affair, exc)
+            return await self._handle_callback_error(callback, name, affair, exc)
 
     async def _handle_callback_error(
         self,
         callback: AsyncCallback,
+        name: str,
         affair: MutableAffair,
         exception: Exception,
     ) -> dict[str, Any] | None:
         """Handle a callback exception via CallbackErrorAffair.
 
         Emits a :class:`CallbackErrorAffair` and reads the merged error
-        policy.  Retry is attempted first; on exhaustion, ``deadletter``
-        and ``silent`` are checked.
+        policy; when nothing listens for it, re-raises immediately.
+        Retry is attempted first, waiting ``retry_backoff`` seconds
+        (doubling per attempt) before each try when set; on exhaustion,
+        ``deadletter`` and ``silent`` are checked.
 
         Always dispatches the error affair with ``"raise"`` strategy to
         ensure error policy dicts are never wrapped by ``list_merge`` or
@@ -142,6 +184,7 @@ class AsyncDispatcher(BaseDispatcher[AsyncCallback]):
 
         Args:
             callback: The callback that raised.
+            name: Display name of *callback*.
             affair: The affair being dispatched.
             exception: The exception that was raised.
 
@@ -152,23 +195,30 @@ class AsyncDispatcher(BaseDispatcher[AsyncCallback]):
         Raises:
             Exception: Re-raises *exception* when no handler suppresses it.
         """
-        error_affair = CallbackErrorAffair(
-            listener_name=callable_name(callback),
+        if not self._registry.has_listeners(CallbackErrorAffair):
+            # No handler could return a policy, so skip building the affair.
+            raise exception
+        error_affair = CallbackErrorAffair._unchecked(
+            listener_name=name,
             original_affair_type=type(affair).__qualname__,
             error_message=str(exception),
             error_type=type(exception).__name__,
         )
         policy = await self.emit(error_affair)
-        retry, deadletter, silent = self._read_error_policy(policy)
+        retry, backoff, deadletter, silent = self._read_error_policy(policy)
         log.debug(
-            "Error policy for {}: retry={}, deadletter={}, silent={}",
-            callable_name(callback),
+            "Error policy for {}: retry={}, retry_backoff={}, deadletter={}, silent={}",
+            name,
             retry,
+            backoff,
             deadletter,
             silent,
         )
         while retry > 0:
             retry -= 1
+            if backoff > 0:
+                await asyncio.sleep(backoff)
+                backoff *= 2
             try:
                 return await callback(affair)
             except Exception:
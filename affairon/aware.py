@@ -4,23 +4,46 @@ from typing import Any
 
 from loguru import logger
 
-from affairon.listen import get_listen_spec
+from affairon.listen import ListenSpec, get_listen_spec
+from affairon.utils import listener_mode_mismatch
 
 log = logger.bind(source=__name__)
 
 
-def _validate_listener_mode(dispatcher: Any, callback: Any) -> None:
-    dispatcher_is_async = inspect.iscoroutinefunction(dispatcher.emit)
-    callback_is_async = inspect.iscoroutinefunction(callback)
-
-    if dispatcher_is_async == callback_is_async:
-        return
-
-    expected = "async" if dispatcher_is_async else "sync"
-    actual = "async" if callback_is_async else "sync"
-    raise TypeError(
-        f"{callback.__qualname__} is {actual}, but {type(dispatcher).__qualname__} "
-        f"requires {expected} callbacks"
+type _ListenedMethod = tuple[str, ListenSpec, bool, tuple[int | None, ...] | None]
+"""``(method name, listen spec, is async, after refs)`` for one ``@listen`` method.
+
+*after refs* parallels ``spec.after``: the index of the referenced method
+in the same table, or None for an external callback used as-is.
+"""
+
+
+def _collect_listened_methods(cls: type) -> tuple[_ListenedMethod, ...]:
+    found: list[tuple[str, Any, ListenSpec]] = []
+    seen: set[str] = set()
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            if name in seen:
+                continue
+            inner = attr
+            if isinstance(attr, (staticmethod, classmethod)):
+                inner = attr.__func__
+            spec = get_listen_spec(inner)
+            if callable(inner) and spec is not None:
+                found.append((name, inner, spec))
+                seen.add(name)
+
+    # Resolve after= references to the class's own methods once, so binding
+    # an instance only has to index its bound methods.
+    index_of = {inner: i for i, (_name, inner, _spec) in enumerate(found)}
+    return tuple(
+        (
+            name,
+            spec,
+            inspect.iscoroutinefunction(inner),
+            tuple(index_of.get(cb) for cb in spec.after) if spec.after else None,
+        )
+        for name, inner, spec in found
     )
 
 
@@ -33,42 +56,52 @@ class AffairAwareMeta(type):
 
 
 class AffairAware(metaclass=AffairAwareMeta):
+    # Empty so the mixin adds no instance layout and combines with builtin
+    # or slotted bases.  A subclass wanting instances without a __dict__
+    # lists "_affair_registrations" in its own __slots__.
+    __slots__ = ()
+
+    _affair_listened: tuple[_ListenedMethod, ...] = ()
     # Each tuple: (dispatcher, affair_types, bound_callback)
     _affair_registrations: list[tuple[Any, list[Any], Any]]
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # The set of @listen methods is fixed per class, so scan the MRO once
+        # here instead of on every instantiation.
+        cls._affair_listened = _collect_listened_methods(cls)
+
     def _bind_affair_methods(self, dispatcher: Any) -> None:
         self._affair_registrations = []
 
-        unbound_to_bound: dict[Any, Any] = {}
-        specs: list[tuple[Any, Any, Any]] = []
-
-        seen: set[str] = set()
-        for klass in type(self).__mro__:
-            for name, attr in vars(klass).items():
-                if name in seen:
-                    continue
-                inner = attr
-                if isinstance(attr, (staticmethod, classmethod)):
-                    inner = attr.__func__
-                spec = get_listen_spec(inner)
-                if callable(inner) and spec is not None:
-                    bound = getattr(self, name)
-                    unbound_to_bound[inner] = bound
-                    specs.append((inner, bound, spec))
-                    seen.add(name)
-
-        if not specs:
+        listened = type(self)._affair_listened
+        if not listened:
             return
 
+        bound_methods = [getattr(self, name) for name, *_ in listened]
+
         if dispatcher is None:
             raise ValueError(f"{type(self).__qualname__} requires dispatcher=...")
 
+        dispatcher_is_async = inspect.iscoroutinefunction(dispatcher.emit)
         try:
-            for _func, bound, spec in specs:
-                _validate_listener_mode(dispatcher, bound)
+            for bound, (_name, spec, is_async, after_refs) in zip(
+                bound_methods, listened, strict=True
+            ):
+                if is_async != dispatcher_is_async:
+                    # Describe the same class-level mode the check used, even
+                    # if the instance attribute was rebound or wrapped.
+                    raise TypeError(
+                        listener_mode_mismatch(
+                            dispatcher, bound, callback_is_async=is_async
+                        )
+                    )
                 after = spec.after
-                if after:
-                    after = [unbound_to_bound.get(cb, cb) for cb in after]
+                if after_refs is not None:
+                    after = [
+                        cb if ref is None else bound_methods[ref]
+                        for cb, ref in zip(spec.after or [], after_refs, strict=True)
+                    ]
                 dispatcher.register(
                     spec.affair_types, bound, after=after, when=spec.when
                 )
@@ -81,7 +114,7 @@ class AffairAware(metaclass=AffairAwareMeta):
 
         log.debug(
             "Bound {} affair method(s) on {}",
-            len(specs),
+            len(listened),
             type(self).__qualname__,
         )
 
@@ -1,9 +1,19 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, cast
 
 from affairon.affairs import MutableAffair
-from affairon.registry import BaseRegistry
+from affairon.registry import BaseRegistry, PlanEntry
+
+
+# Bounded so affair classes created at runtime are not pinned forever.
+@lru_cache(maxsize=1024)
+def _mro_affair_types(
+    affair_cls: type[MutableAffair],
+) -> tuple[type[MutableAffair], ...]:
+    """Compute (once per class) the MutableAffair types in its MRO."""
+    return tuple(t for t in affair_cls.__mro__ if issubclass(t, MutableAffair))
 
 
 class BaseDispatcher[CB](ABC):
@@ -17,17 +27,11 @@ class BaseDispatcher[CB](ABC):
     - emit() - Affair dispatching logic
     """
 
-    _guardian: CB  # Guardian callback to anchor execution order
     _registry: BaseRegistry[CB]  # Registry for managing listeners
 
-    def __init__(self, guardian: CB) -> None:
-        """Initialize dispatcher.
-
-        Args:
-            guardian: Guardian callback to anchor execution order.
-        """
-        self._guardian = guardian
-        self._registry = BaseRegistry[CB](self._guardian)
+    def __init__(self) -> None:
+        """Initialize dispatcher with an empty registry."""
+        self._registry = BaseRegistry[CB]()
 
     def on[A: MutableAffair, R: (dict[str, Any] | None)](
         self,
@@ -150,21 +154,31 @@ class BaseDispatcher[CB](ABC):
         raise NotImplementedError
 
     @staticmethod
-    def _read_error_policy(policy: dict[str, Any]) -> tuple[int, bool, bool]:
+    def _read_error_policy(
+        policy: dict[str, Any],
+    ) -> tuple[int, float, bool, bool]:
         """Extract error-handling control keys from a merged handler result.
 
-        Reads ``retry``, ``deadletter``, and ``silent`` from *policy*,
-        applying safe type coercion and defaults.
+        Reads ``retry``, ``retry_backoff``, ``deadletter``, and ``silent``
+        from *policy*, applying safe type coercion and defaults.
+
+        ``retry_backoff`` is the delay in seconds before the first retry;
+        it doubles after every failed attempt.  The default ``0`` retries
+        immediately.
 
         Args:
             policy: Merged dict returned by CallbackErrorAffair handlers.
 
         Returns:
-            Tuple of (retry, deadletter, silent).
+            Tuple of (retry, retry_backoff, deadletter, silent).
 
         Raises:
-            TypeError: If ``retry`` cannot be converted to int.
+            TypeError: If ``retry`` cannot be converted to int or
+                ``retry_backoff`` cannot be converted to float.
         """
+        if not policy:
+            # No error handler, or none returned control keys.
+            return 0, 0.0, False, False
         retry_raw = policy.get("retry", 0)
         try:
             retry = int(retry_raw)
@@ -173,30 +187,48 @@ class BaseDispatcher[CB](ABC):
                 f"'retry' must be int-convertible, got {type(retry_raw).__name__}: "
                 f"{retry_raw!r}"
             ) from exc
+        backoff_raw = policy.get("retry_backoff", 0.0)
+        try:
+            backoff = float(backoff_raw)
+        except (ValueError, TypeError) as exc:
+            raise TypeError(
+                "'retry_backoff' must be float-convertible, got "
+                f"{type(backoff_raw).__name__}: {backoff_raw!r}"
+            ) from exc
         deadletter = bool(policy.get("deadletter", False))
         silent = bool(policy.get("silent", False))
-        return retry, deadletter, silent
+        return retry, backoff, deadletter, silent
 
-    @staticmethod
-    def _resolve_affair_types(
-        affair: MutableAffair,
-    ) -> list[type[MutableAffair]]:
-        """Determine which affair types to dispatch for.
+    def _plan_for(self, affair: MutableAffair) -> tuple[tuple[PlanEntry[CB], ...], ...]:
+        """Return the cached execution plan for an emitted affair.
+
+        When ``affair.emit_up`` is False, this is the plan of the concrete
+        type alone.  When True, the plans of all ``MutableAffair`` classes
+        in its MRO are concatenated from child to parent.
+
+        Args:
+            affair: The affair instance being emitted.
+
+        Returns:
+            Layers of ``(callback, name, when)`` entries in dispatch order.
+        """
+        if not affair.emit_up:
+            return self._registry.exec_plan(type(affair))
+        return self._registry.walk_plan(_mro_affair_types(type(affair)))
+
+    def _flat_plan_for(self, affair: MutableAffair) -> tuple[PlanEntry[CB], ...]:
+        """Return the cached execution plan for an emitted affair, flattened.
 
-        When ``affair.emit_up`` is False, returns only the concrete type.
-        When True, walks the MRO and returns all ``MutableAffair``
-        subclasses from child to parent.
+        Same callbacks and order as :meth:`_plan_for`, without layer
+        boundaries.
 
         Args:
             affair: The affair instance being emitted.
 
         Returns:
-            Ordered list of affair types (child-first) to dispatch.
+            ``(callback, name, when)`` entries in dispatch order.
         """
+        affair_cls = type(affair)
         if not affair.emit_up:
-            return [type(affair)]
-        return [
-            t
-            for t in type(affair).__mro__
-            if isinstance(t, type) and issubclass(t, MutableAffair)
-        ]
+            return self._registry.flat_plan((affair_cls,))
+        return self._registry.flat_plan(_mro_affair_types(affair_cls))
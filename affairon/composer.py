@@ -1,13 +1,12 @@
 import importlib
 import importlib.metadata
-import inspect
 import tomllib
+from importlib.metadata import EntryPoint
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 from packaging.requirements import Requirement
-from packaging.version import Version
 
 from affairon.exceptions import (
     PluginConfigError,
@@ -18,7 +17,7 @@ from affairon.exceptions import (
     PluginVersionError,
 )
 from affairon.listen import get_listen_spec
-from affairon.utils import normalize_name
+from affairon.utils import listener_mode_mismatch, normalize_name
 
 log = logger.bind(source=__name__)
 
@@ -31,21 +30,6 @@ def _config_section_name(profile: str | None) -> str:
     return f"[tool.affairon.profiles.{profile}]"
 
 
-def _validate_listener_mode(dispatcher: Any, callback: Any) -> None:
-    dispatcher_is_async = inspect.iscoroutinefunction(dispatcher.emit)
-    callback_is_async = inspect.iscoroutinefunction(callback)
-
-    if dispatcher_is_async == callback_is_async:
-        return
-
-    expected = "async" if dispatcher_is_async else "sync"
-    actual = "async" if callback_is_async else "sync"
-    raise PluginTargetError(
-        f"{callback.__qualname__} is {actual}, but {type(dispatcher).__qualname__} "
-        f"requires {expected} callbacks"
-    )
-
-
 class PluginComposer:
     def __init__(self, dispatcher: Any) -> None:
         self.dispatcher = dispatcher
@@ -53,9 +37,17 @@ class PluginComposer:
         self.loaded_local_plugins: set[str] = set()
 
     def compose(self, plugin_requirements: list[str]) -> None:
-        for req_str in plugin_requirements:
+        if not plugin_requirements:
+            return
+        # One metadata scan for the whole batch instead of one per plugin.
+        plugin_entry_points: dict[str, EntryPoint] = {}
+        for ep in importlib.metadata.entry_points(group=ENTRY_POINT_GROUP):
+            plugin_entry_points.setdefault(ep.name, ep)
+
+        # dict.fromkeys drops repeated strings, keeping first-seen order.
+        for req_str in dict.fromkeys(plugin_requirements):
             requirement = Requirement(req_str)
-            self._load_plugin(requirement)
+            self._load_plugin(requirement, plugin_entry_points)
 
     def compose_local(self, modules: list[str]) -> None:
         for module_path in modules:
@@ -71,9 +63,14 @@ class PluginComposer:
         self, pyproject_path: Path, profile: str | None = None
     ) -> None:
         try:
-            with pyproject_path.open("rb") as fh:
-                config = tomllib.load(fh)
-        except tomllib.TOMLDecodeError as err:
+            data = pyproject_path.read_bytes()
+        except OSError as err:
+            raise PluginConfigError(
+                f"Failed to read pyproject.toml '{pyproject_path}': {err}"
+            ) from err
+        try:
+            config = tomllib.loads(data.decode())
+        except (tomllib.TOMLDecodeError, UnicodeDecodeError) as err:
             raise PluginConfigError(
                 f"Failed to parse pyproject.toml '{pyproject_path}': {err}"
             ) from err
@@ -173,7 +170,9 @@ class PluginComposer:
             )
         return value
 
-    def _load_plugin(self, requirement: Requirement) -> None:
+    def _load_plugin(
+        self, requirement: Requirement, plugin_entry_points: dict[str, EntryPoint]
+    ) -> None:
         plugin_name = requirement.name
         normalized_name = normalize_name(plugin_name)
 
@@ -188,21 +187,22 @@ class PluginComposer:
                 f"Required plugin '{plugin_name}' is not installed"
             ) from err
 
-        installed_version = Version(dist.version)
-        if not requirement.specifier.contains(installed_version):
+        installed_version = dist.version
+        # A bare requirement accepts any installed version; skip parsing it.
+        specifier = requirement.specifier
+        if specifier and not specifier.contains(installed_version):
             raise PluginVersionError(
                 f"Plugin '{plugin_name}' version {installed_version} "
                 f"does not satisfy requirement '{requirement}'"
             )
 
-        eps = importlib.metadata.entry_points(group=ENTRY_POINT_GROUP, name=plugin_name)
-        if not eps:
+        ep = plugin_entry_points.get(plugin_name)
+        if ep is None:
             raise PluginEntryPointError(
                 f"Plugin '{plugin_name}' has no entry point "
                 f"in group '{ENTRY_POINT_GROUP}'"
             )
 
-        ep = next(iter(eps))
         module_path = ep.value.split(":", 1)[0]
         self._import_and_register_module(module_path, plugin_label=plugin_name)
 
@@ -222,7 +222,8 @@ class PluginComposer:
         try:
             module = importlib.import_module(module_path)
         except Exception as exc:
-            log.exception("Failed to import plugin module '{}'", module_path)
+            # The traceback travels with the chained PluginImportError.
+            log.error("Failed to import plugin module '{}': {}", module_path, exc)
             raise PluginImportError(
                 f"Failed to import plugin module '{module_path}': {exc}"
             ) from exc
@@ -247,7 +248,9 @@ class PluginComposer:
 
         try:
             for callback, spec in callback_specs:
-                _validate_listener_mode(self.dispatcher, callback)
+                mismatch = listener_mode_mismatch(self.dispatcher, callback)
+                if mismatch is not None:
+                    raise PluginTargetError(mismatch)
                 after = spec.after
                 if after:
                     after = [module_callbacks.get(cb, cb) for cb in after]
@@ -1,5 +1,6 @@
 """Synchronous dispatcher for affair handling."""
 
+import time
 from typing import Any
 
 from loguru import logger
@@ -7,7 +8,7 @@ from loguru import logger
 from affairon._types import SyncCallback
 from affairon.affairs import CallbackErrorAffair, MutableAffair
 from affairon.base_dispatcher import BaseDispatcher
-from affairon.utils import callable_name, merge_dict
+from affairon.utils import MERGERS
 
 log = logger.bind(source=__name__)
 
@@ -19,13 +20,6 @@ class Dispatcher(BaseDispatcher[SyncCallback]):
     Recursive emit() calls execute directly (no queue).
     """
 
-    @staticmethod
-    def _sample_guardian(affair: MutableAffair) -> None:
-        """Silent guardian callback to anchor execution order."""
-
-    def __init__(self):
-        super().__init__(self._sample_guardian)
-
     def emit(self, affair: MutableAffair) -> dict[str, Any]:
         """Synchronously dispatch affair.
 
@@ -35,7 +29,8 @@ class Dispatcher(BaseDispatcher[SyncCallback]):
 
         If a callback raises an exception, the dispatcher emits a
         :class:`CallbackErrorAffair`.  Error handlers may return control
-        keys (``retry``, ``deadletter``, ``silent``) to influence recovery.
+        keys (``retry``, ``retry_backoff``, ``deadletter``, ``silent``) to
+        influence recovery.
         Priority: retry first → deadletter → silent → re-raise.
 
         Warning:
@@ -58,49 +53,42 @@ class Dispatcher(BaseDispatcher[SyncCallback]):
                 (only when ``affair.merge_strategy`` is ``"raise"``).
             RecursionError: If listeners form infinite recursion chain.
         """
-        strategy = affair.merge_strategy
+        # Callbacks run one at a time, so layer boundaries are irrelevant
+        plan = self._flat_plan_for(affair)
+        if not plan:
+            return {}
+        merge = MERGERS[affair.merge_strategy]
         merged_result: dict[str, Any] = {}
-        affair_types = self._resolve_affair_types(affair)
-        log.debug(
-            "Emit {} (types={})",
-            type(affair).__qualname__,
-            [t.__qualname__ for t in affair_types],
-        )
-        for affair_type in affair_types:
-            layers = self._registry.exec_order(affair_type)
-            for layer in layers:
-                for cb in layer:
-                    if not self._registry.should_fire(cb, affair_type, affair):
-                        continue
-                    try:
-                        result = cb(affair)
-                    except Exception as exc:
-                        result = self._handle_callback_error(cb, affair, exc)
-                    if result is not None:
-                        if not isinstance(result, dict):
-                            raise TypeError(
-                                f"Callback {callable_name(cb)} returned "
-                                f"{type(result).__name__}, expected dict or None"
-                            )
-                        merge_dict(
-                            merged_result,
-                            result,
-                            strategy=strategy,
-                            source_name=callable_name(cb),
-                        )
+        for cb, name, when in plan:
+            if when is not None and not when(affair):
+                continue
+            try:
+                result = cb(affair)
+            except Exception as exc:
+                result = self._handle_callback_error(cb, name, affair, exc)
+            if result is not None:
+                if not isinstance(result, dict):
+                    raise TypeError(
+                        f"Callback {name} returned "
+                        f"{type(result).__name__}, expected dict or None"
+                    )
+                merge(merged_result, result, name)
         return merged_result
 
     def _handle_callback_error(
         self,
         callback: SyncCallback,
+        name: str,
         affair: MutableAffair,
         exception: Exception,
     ) -> dict[str, Any] | None:
         """Handle a callback exception via CallbackErrorAffair.
 
         Emits a :class:`CallbackErrorAffair` and reads the merged error
-        policy.  Retry is attempted first; on exhaustion, ``deadletter``
-        and ``silent`` are checked.
+        policy; when nothing listens for it, re-raises immediately.
+        Retry is attempted first, waiting ``retry_backoff`` seconds
+        (doubling per attempt) before each try when set; on exhaustion,
+        ``deadletter`` and ``silent`` are checked.
 
         ``CallbackErrorAffair`` defaults to ``merge_strategy="raise"``,
         so error policy dicts are never wrapped by ``list_merge`` or
@@ -108,6 +96,7 @@ class Dispatcher(BaseDispatcher[SyncCallback]):
 
         Args:
             callback: The callback that raised.
+            name: Display name of *callback*.
             affair: The affair being dispatched.
             exception: The exception that was raised.
 
@@ -118,23 +107,30 @@ class Dispatcher(BaseDispatcher[SyncCallback]):
         Raises:
             Exception: Re-raises *exception* when no handler suppresses it.
         """
-        error_affair = CallbackErrorAffair(
-            listener_name=callable_name(callback),
+        if not self._registry.has_listeners(CallbackErrorAffair):
+            # No handler could return a policy, so skip building the affair.
+            raise exception
+        error_affair = CallbackErrorAffair._unchecked(
+            listener_name=name,
             original_affair_type=type(affair).__qualname__,
             error_message=str(exception),
             error_type=type(exception).__name__,
         )
         policy = self.emit(error_affair)
-        retry, deadletter, silent = self._read_error_policy(policy)
+        retry, backoff, deadletter, silent = self._read_error_policy(policy)
         log.debug(
-            "Error policy for {}: retry={}, deadletter={}, silent={}",
-            callable_name(callback),
+            "Error policy for {}: retry={}, retry_backoff={}, deadletter={}, silent={}",
+            name,
             retry,
+            backoff,
             deadletter,
             silent,
         )
         while retry > 0:
             retry -= 1
+            if backoff > 0:
+                time.sleep(backoff)
+                backoff *= 2
             try:
                 return callback(affair)
             except Exception:
@@ -8,6 +8,7 @@ dispatcher, and emits ``AffairMain``.
 import argparse
 import asyncio
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 from loguru import logger
@@ -39,9 +40,40 @@ def _build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Use the async dispatcher to emit AffairMain.",
     )
+    parser.add_argument(
+        "--uvloop",
+        dest="use_uvloop",
+        action="store_true",
+        default=False,
+        help="Run --async on the uvloop event loop (requires uvloop).",
+    )
     return parser
 
 
+def _loop_factory(use_uvloop: bool) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return the event loop constructor for ``--async`` runs.
+
+    Args:
+        use_uvloop: Whether ``--uvloop`` was passed.
+
+    Returns:
+        ``uvloop.new_event_loop`` when requested, else None so that
+        ``asyncio.run`` uses the stock event loop.
+
+    Raises:
+        SystemExit: If uvloop was requested but is not installed.
+    """
+    if not use_uvloop:
+        return None
+    try:
+        import uvloop  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        log.error("--uvloop requires uvloop to be installed")
+        sys.exit(1)
+    log.debug("Using uvloop event loop")
+    return uvloop.new_event_loop
+
+
 def main(argv: list[str] | None = None) -> None:
     """CLI entry point: discover pyproject, compose plugins, emit AffairMain.
 
@@ -50,6 +82,10 @@ def main(argv: list[str] | None = None) -> None:
     """
     parser = _build_parser()
     args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+    if args.use_uvloop and not args.use_async:
+        parser.error("--uvloop requires --async")
+    # Resolved before composing so a missing uvloop fails before plugins load.
+    loop_factory = _loop_factory(args.use_uvloop)
 
     project_path: Path = args.project_path.resolve()
 
@@ -68,7 +104,7 @@ def main(argv: list[str] | None = None) -> None:
         composer.compose_from_pyproject(pyproject_path)
         affair = AffairMain(project_path=project_path, dispatcher=dispatcher)
         log.info("Starting application (async) from {}", project_path)
-        asyncio.run(dispatcher.emit(affair))
+        asyncio.run(dispatcher.emit(affair), loop_factory=loop_factory)
     else:
         dispatcher = default_dispatcher
         composer = PluginComposer(dispatcher)
@@ -5,7 +5,7 @@ from typing import Any, cast
 from affairon.affairs import MutableAffair
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListenSpec:
     affair_types: list[type[MutableAffair]]
     after: list[Any] | None
@@ -1,13 +1,13 @@
 """Registry for listener management.
 
 This module provides BaseRegistry for storing and querying listeners,
-with topological sorting and execution plan layering using NetworkX.
+with cycle detection and execution plan layering (Kahn's algorithm) over
+per-affair-type dependency graphs.
 """
 
-from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 
-import networkx as nx
 from loguru import logger
 
 from affairon.affairs import MutableAffair
@@ -16,28 +16,116 @@ from affairon.utils import callable_name
 
 log = logger.bind(source=__name__)
 
+type PlanEntry[CB] = tuple[CB, str, Callable[[MutableAffair], bool] | None]
+"""One scheduled callback: ``(callback, display name, when predicate)``."""
+
+
+@dataclass(slots=True)
+class _Node[CB]:
+    """A registered callback and its ``after`` edges within one graph."""
+
+    name: str
+    when: Callable[[MutableAffair], bool] | None
+    # Insertion-ordered sets of the callbacks this one runs after / before
+    preds: dict[CB, None] = field(default_factory=dict)
+    succs: dict[CB, None] = field(default_factory=dict)
+
+
+type _Graph[CB] = dict[CB, _Node[CB]]
+"""Callbacks of one affair type, in registration order."""
+
+
+def _find_path[CB](graph: _Graph[CB], start: CB, targets: Iterable[CB]) -> list[CB]:
+    """Return a successor path from *start* to any of *targets*, or []."""
+    wanted = set(targets)
+    parent: dict[CB, CB] = {}
+    seen = {start}
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        if node in wanted:
+            path = [node]
+            while node in parent:
+                node = parent[node]
+                path.append(node)
+            path.reverse()
+            return path
+        for succ in graph[node].succs:
+            if succ not in seen:
+                seen.add(succ)
+                parent[succ] = node
+                stack.append(succ)
+    return []
+
+
+def _layers[CB](graph: _Graph[CB]) -> tuple[tuple[CB, ...], ...]:
+    """Group callbacks into execution layers with Kahn's algorithm.
+
+    A callback lands one layer past the deepest of its ``after``
+    dependencies, so it never shares a layer with anything it waits on.
+    Within a layer, callbacks keep registration order.
+    """
+    position = {cb: i for i, cb in enumerate(graph)}
+    pending = {cb: len(node.preds) for cb, node in graph.items()}
+    layer = [cb for cb, count in pending.items() if count == 0]
+    layers: list[tuple[CB, ...]] = []
+    while layer:
+        layers.append(tuple(layer))
+        ready: list[CB] = []
+        for cb in layer:
+            for succ in graph[cb].succs:
+                pending[succ] -= 1
+                if pending[succ] == 0:
+                    ready.append(succ)
+        ready.sort(key=position.__getitem__)
+        layer = ready
+    return tuple(layers)
+
 
 class BaseRegistry[CB]:
     """Registry table for affair listeners.
 
     Manages listener registration, removal, and execution order resolution
-    with priority layering and topological sorting using NetworkX.
+    with cycle detection and topological layering.
 
     Each affair type has its own dependency graph for callback relationships.
     Only callbacks explicitly registered for a given affair type are included;
     parent affair type callbacks are NOT inherited (no MRO expansion).
     """
 
-    def __init__(self, guardian: CB) -> None:
+    __slots__ = (
+        "_graphs",
+        "_order_cache",
+        "_plan_cache",
+        "_walk_cache",
+        "_flat_cache",
+    )
+
+    def __init__(self) -> None:
         """Initialize empty registry.
 
         Post:
-            _graphs is empty dict mapping affair types to DiGraphs.
+            _graphs is empty dict mapping affair types to dependency graphs.
+            _order_cache, _plan_cache, _walk_cache and _flat_cache are
+            empty.
         """
-        self._guardian = guardian
-        self._graphs: defaultdict[type[MutableAffair], nx.DiGraph[CB]] = defaultdict(
-            nx.DiGraph
-        )
+        self._graphs: dict[type[MutableAffair], _Graph[CB]] = {}
+        # Memoized exec_order()/exec_plan() layers, invalidated per type on
+        # add/remove
+        self._order_cache: dict[type[MutableAffair], tuple[tuple[CB, ...], ...]] = {}
+        self._plan_cache: dict[
+            type[MutableAffair], tuple[tuple[PlanEntry[CB], ...], ...]
+        ] = {}
+        # Concatenated plans for MRO walks, keyed by the affair type tuple;
+        # cleared on any change since a key spans several graphs
+        self._walk_cache: dict[
+            tuple[type[MutableAffair], ...], tuple[tuple[PlanEntry[CB], ...], ...]
+        ] = {}
+        # Layer-free plans for dispatchers that only need the total order;
+        # keyed and cleared like _walk_cache
+        self._flat_cache: dict[
+            tuple[type[MutableAffair], ...], tuple[PlanEntry[CB], ...]
+        ] = {}
 
     def add(
         self,
@@ -48,6 +136,10 @@ class BaseRegistry[CB]:
     ) -> None:
         """Register a listener for specified affair types.
 
+        Registering a callback again for the same affair type replaces its
+        ``when`` predicate and adds the new ``after`` edges to its existing
+        ones.
+
         Args:
             affair_types: MutableAffair types to register for.
             callback: Listener callback function.
@@ -63,40 +155,42 @@ class BaseRegistry[CB]:
             ValueError: If entry.after references unregistered callbacks.
             CyclicDependencyError: If entry.after forms a cycle.
         """
-        # Add the entry for each affair type
+        deps = after or []
         for affair_type in affair_types:
-            # defaultdict ensures graph exists for affair_type
-            graph = self._graphs[affair_type]
-
-            # Ensure the guardian node exists
-            # Note that add_node is idempotent
-            graph.add_node(self._guardian)
+            graph = self._graphs.get(affair_type, {})
 
             # Check that all 'after' dependencies exist
-            for dep in after or []:
+            for dep in deps:
                 if dep not in graph:
                     raise ValueError(
-                        f"after={dep.__qualname__} not registered for affair type "
-                        f"{affair_type.__qualname__}"
+                        f"after={callable_name(dep)} not registered for affair "
+                        f"type {affair_type.__qualname__}"
                     )
 
-            graph.add_node(callback, when=when)
+            node = graph.get(callback)
+            if node is None:
+                node = _Node[CB](callable_name(callback), when)
+            else:
+                # The graph is acyclic and only edges into callback are new, so
+                # a cycle appears exactly when callback already reaches one of
+                # deps.  Checking before mutating leaves nothing to roll back.
+                path = _find_path(graph, callback, deps)
+                if path:
+                    cycle = " -> ".join(callable_name(cb) for cb in [*path, callback])
+                    raise CyclicDependencyError(
+                        f"cyclic dependency detected: adding "
+                        f"{callable_name(callback)} would create a cycle in "
+                        f"{affair_type.__qualname__} - cycle: {cycle}"
+                    )
+                node.when = when
 
+            graph[callback] = node
             # Add dependency edges (dep -> callback means dep executes before callback)
-            for dep in after or [self._guardian]:
-                graph.add_edge(dep, callback)
-
-            # Check for cycles
-            if cycles := list(nx.simple_cycles(graph)):
-                # Rollback: remove entry
-                # Note that removing the node will also remove all its edges
-                graph.remove_node(callback)
-
-                raise CyclicDependencyError(
-                    f"cyclic dependency detected: adding {callback.__qualname__} "
-                    f"would create a cycle in {affair_type.__qualname__}"
-                    f" - cycles: {cycles}"
-                )
+            for dep in deps:
+                node.preds[dep] = None
+                graph[dep].succs[callback] = None
+            self._graphs[affair_type] = graph
+            self._invalidate(affair_type)
 
             log.debug(
                 "Registered {} on {}",
@@ -116,13 +210,16 @@ class BaseRegistry[CB]:
         - (affair_types, None): Remove all listeners from specified affair types.
         - (None, callback): Remove callback from all affair types.
 
+        Callbacks that declared ``after`` on a removed callback lose that
+        dependency and keep firing.
+
         Args:
             affair_types: MutableAffair types to remove from, or None for all.
             callback: Callback to remove, or None for all.
 
         Post:
             Matching entries removed from affair graphs.
-            Corresponding nodes/edges removed if no longer referenced.
+            Corresponding edges removed; empty graphs dropped.
 
         Raises:
             ValueError: If both args are None.
@@ -137,20 +234,21 @@ class BaseRegistry[CB]:
                 # Get the graph for this affair (skip if not exists)
                 if affair_type not in self._graphs:
                     continue
+                self._invalidate(affair_type)
 
                 graph = self._graphs[affair_type]
 
                 # If func requested, only remove the func node
                 if callback is not None:
                     if callback in graph:
-                        graph.remove_node(callback)
+                        self._remove_node(graph, callback)
                         log.debug(
                             "Unregistered {} from {}",
                             callable_name(callback),
                             affair_type.__qualname__,
                         )
                         # Clean up empty graph
-                        if len(graph) == 0:
+                        if not graph:
                             del self._graphs[affair_type]
                 else:
                     # If no func requested, delete the affair key
@@ -166,20 +264,41 @@ class BaseRegistry[CB]:
             affairs_to_clean = []
             for affair_type, graph in self._graphs.items():
                 if callback in graph:
-                    graph.remove_node(callback)
+                    self._invalidate(affair_type)
+                    self._remove_node(graph, callback)
                     log.debug(
                         "Unregistered {} from {}",
                         callable_name(callback),
                         affair_type.__qualname__,
                     )
                     # Mark for cleanup if empty
-                    if len(graph) == 0:
+                    if not graph:
                         affairs_to_clean.append(affair_type)
 
             # Clean up empty graphs
             for affair_type in affairs_to_clean:
                 del self._graphs[affair_type]
 
+    @staticmethod
+    def _remove_node(graph: _Graph[CB], callback: CB) -> None:
+        """Remove *callback* and every edge touching it from *graph*."""
+        node = graph.pop(callback)
+        for dep in node.preds:
+            graph[dep].succs.pop(callback, None)
+        for succ in node.succs:
+            graph[succ].preds.pop(callback, None)
+
+    def has_listeners(self, affair_type: type[MutableAffair]) -> bool:
+        """Check whether any callback is registered for an affair type.
+
+        Args:
+            affair_type: MutableAffair type to check.
+
+        Returns:
+            True if the affair type has a dependency graph.
+        """
+        return affair_type in self._graphs
+
     def should_fire(
         self,
         callback: CB,
@@ -200,29 +319,132 @@ class BaseRegistry[CB]:
         graph = self._graphs.get(affair_type)
         if graph is None:
             return False
-        when = graph.nodes[callback].get("when")
+        when = graph[callback].when
         if when is None:
             return True
         return when(affair)
 
-    def exec_order(self, affair_type: type[MutableAffair]) -> list[list[CB]]:
-        """Return execution order for an affair type using breadth-first enumeration.
+    def exec_order(
+        self, affair_type: type[MutableAffair]
+    ) -> tuple[tuple[CB, ...], ...]:
+        """Return execution order for an affair type as dependency layers.
 
-        Performs a breadth-first traversal of the dependency graph for the affair type
-        and returns a 2D list of callbacks in layers of execution order.
+        Layers the dependency graph for the affair type with Kahn's
+        algorithm: every callback sits one layer after the deepest of its
+        ``after`` dependencies, and callbacks within a layer keep
+        registration order.  The result is an immutable tuple cached until
+        the affair type's graph changes, so it is shared between callers
+        without copying.
 
         Args:
             affair_type: MutableAffair type to resolve.
 
         Returns:
-            2D list of callbacks in layers of execution order
+            Tuple of callback layers in execution order
             (dependencies before dependents).
         """
+        cached = self._order_cache.get(affair_type)
+        if cached is not None:
+            return cached
+
         # Get the graph for the affair type
-        if affair_type not in self._graphs:
-            return []
+        graph = self._graphs.get(affair_type)
+        if graph is None:
+            return ()
+
+        layers = _layers(graph)
+        self._order_cache[affair_type] = layers
+        return layers
+
+    def exec_plan(
+        self, affair_type: type[MutableAffair]
+    ) -> tuple[tuple[PlanEntry[CB], ...], ...]:
+        """Return the execution order with per-callback dispatch metadata.
+
+        Same layering as :meth:`exec_order`, but each callback comes with
+        the name resolved once at registration and its ``when`` predicate
+        (None when unconditional), so dispatchers neither re-derive names
+        nor call :meth:`should_fire` for callbacks without a predicate.
+        Cached and shared like :meth:`exec_order`.
+
+        Args:
+            affair_type: MutableAffair type to resolve.
+
+        Returns:
+            Tuple of ``(callback, name, when)`` layers in execution order.
+        """
+        cached = self._plan_cache.get(affair_type)
+        if cached is not None:
+            return cached
+
+        layers = self.exec_order(affair_type)
+        if not layers:
+            return ()
 
         graph = self._graphs[affair_type]
-        return list(nx.bfs_layers(graph, sources=[self._guardian]))[
-            1:
-        ]  # Exclude guardian layer
+        plan = tuple(
+            tuple((cb, graph[cb].name, graph[cb].when) for cb in layer)
+            for layer in layers
+        )
+        self._plan_cache[affair_type] = plan
+        log.debug(
+            "Built execution plan for {} ({} layers)",
+            affair_type.__qualname__,
+            len(plan),
+        )
+        return plan
+
+    def walk_plan(
+        self, affair_types: tuple[type[MutableAffair], ...]
+    ) -> tuple[tuple[PlanEntry[CB], ...], ...]:
+        """Return the execution plans of several affair types, concatenated.
+
+        Layers of ``affair_types[0]`` come first, then those of the next
+        type, and so on.  Used for ``emit_up`` dispatch so a walk over the
+        MRO is a single iteration over cached layers.
+
+        Args:
+            affair_types: Affair types in dispatch order.
+
+        Returns:
+            Tuple of ``(callback, name, when)`` layers in execution order.
+        """
+        cached = self._walk_cache.get(affair_types)
+        if cached is None:
+            cached = tuple(
+                layer
+                for affair_type in affair_types
+                for layer in self.exec_plan(affair_type)
+            )
+            self._walk_cache[affair_types] = cached
+        return cached
+
+    def flat_plan(
+        self, affair_types: tuple[type[MutableAffair], ...]
+    ) -> tuple[PlanEntry[CB], ...]:
+        """Return :meth:`walk_plan` with the layers flattened.
+
+        For dispatchers that run callbacks one at a time, layer boundaries
+        carry no meaning; a flat tuple lets them iterate once per callback
+        instead of once per layer and once per callback.
+
+        Args:
+            affair_types: Affair types in dispatch order.
+
+        Returns:
+            Tuple of ``(callback, name, when)`` entries in execution order.
+        """
+        cached = self._flat_cache.get(affair_types)
+        if cached is None:
+            cached = tuple(
+                entry for layer in self.walk_plan(affair_types) for entry in layer
+            )
+            self._flat_cache[affair_types] = cached
+        return cached
+
+    def _invalidate(self, affair_type: type[MutableAffair]) -> None:
+        """Drop cached layers for an affair type after its graph changes."""
+        self._order_cache.pop(affair_type, None)
+        self._plan_cache.pop(affair_type, None)
+        self._walk_cache.clear()
+        self._flat_cache.clear()
@@ -1,9 +1,13 @@
+import inspect
 import re
+from collections.abc import Callable
 from typing import Any
 
 from affairon.affairs import MergeStrategy
 from affairon.exceptions import KeyConflictError
 
+_NAME_SEPARATORS = re.compile(r"[-_.]+")
+
 
 def callable_name(cb: Any) -> str:
     """Return a human-readable name for a callable, safe for logging.
@@ -23,6 +27,35 @@ def callable_name(cb: Any) -> str:
     )
 
 
+def listener_mode_mismatch(
+    dispatcher: Any, callback: Any, *, callback_is_async: bool | None = None
+) -> str | None:
+    """Describe a sync/async mismatch between a dispatcher and a callback.
+
+    Args:
+        dispatcher: Dispatcher the callback is about to be registered on.
+        callback: Listener callback.
+        callback_is_async: Precomputed mode of *callback*; inspected from
+            *callback* when None.
+
+    Returns:
+        Error message, or None when both are sync or both are async.
+    """
+    dispatcher_is_async = inspect.iscoroutinefunction(dispatcher.emit)
+    if callback_is_async is None:
+        callback_is_async = inspect.iscoroutinefunction(callback)
+
+    if dispatcher_is_async == callback_is_async:
+        return None
+
+    expected = "async" if dispatcher_is_async else "sync"
+    actual = "async" if callback_is_async else "sync"
+    return (
+        f"{callback.__qualname__} is {actual}, but {type(dispatcher).__qualname__} "
+        f"requires {expected} callbacks"
+    )
+
+
 def normalize_name(name: str) -> str:
     """Normalize a package/plugin name per PEP 503.
 
@@ -36,98 +69,78 @@ def normalize_name(name: str) -> str:
     Returns:
         Normalized name string.
     """
-    return re.sub(r"[-_.]+", "-", name).lower()
+    if "_" not in name and "." not in name and "--" not in name:
+        # Already hyphen-separated (the common case): only case can differ.
+        return name.lower()
+    return _NAME_SEPARATORS.sub("-", name).lower()
 
 
 # ---------------------------------------------------------------------------
 # Merge helpers
 # ---------------------------------------------------------------------------
 
+type Merger = Callable[[dict[str, Any], dict[str, Any], str], None]
+"""Merge a callback's ``source`` dict into ``target`` in place.
 
-def _wrap_value(strategy: MergeStrategy, value: Any, source_name: str) -> Any:
-    """Transform a value on first insertion based on merge strategy.
+The third argument is the callback display name (used by ``dict_merge``).
+"""
 
-    For ``list_merge`` every value is stored as a single-element list;
-    for ``dict_merge`` every value is stored as ``{source_name: value}``.
-    Other strategies store the raw value.
 
-    Args:
-        strategy: Active merge strategy.
-        value: Raw value from callback return dict.
-        source_name: Callback display name.
+def _merge_raise(target: dict[str, Any], source: dict[str, Any], _name: str) -> None:
+    """``raise``: reject any key already present in *target*."""
+    if not target:
+        # First result of the emit: nothing to conflict with.
+        target.update(source)
+        return
+    for key, value in source.items():
+        if key in target:
+            raise KeyConflictError(f"Key conflict: {{'{key}'}}")
+        target[key] = value
 
-    Returns:
-        Wrapped value (list / dict) or original value.
-    """
-    match strategy:
-        case "list_merge":
-            return [value]
-        case "dict_merge":
-            return {source_name: value}
-        case _:
-            return value
-
-
-def _resolve_conflict(
-    strategy: MergeStrategy,
-    key: str,
-    existing: Any,
-    new_value: Any,
-    source_name: str,
-) -> Any:
-    """Resolve a key conflict between existing and new values.
 
-    Args:
-        strategy: Active merge strategy.
-        key: The conflicting key.
-        existing: Current value in target.
-        new_value: Incoming value from source.
-        source_name: Callback display name.
+def _merge_keep(target: dict[str, Any], source: dict[str, Any], _name: str) -> None:
+    """``keep``: the first value stored for a key wins."""
+    if not target:
+        target.update(source)
+        return
+    for key, value in source.items():
+        target.setdefault(key, value)
 
-    Returns:
-        Resolved value.
 
-    Raises:
-        KeyConflictError: When strategy is ``raise``.
-    """
-    match strategy:
-        case "raise":
-            raise KeyConflictError(f"Key conflict: {{'{key}'}}")
-        case "keep":
-            return existing
-        case "override":
-            return new_value
-        case "list_merge":
-            existing.append(new_value)
-            return existing
-        case "dict_merge":
-            existing[source_name] = new_value
-            return existing
-
-
-def merge_dict(
-    target: dict[str, Any],
-    source: dict[str, Any],
-    *,
-    strategy: MergeStrategy = "raise",
-    source_name: str = "",
-) -> None:
-    """Merge source dict into target dict using the given strategy.
+def _merge_override(target: dict[str, Any], source: dict[str, Any], _name: str) -> None:
+    """``override``: the last value stored for a key wins."""
+    target.update(source)
 
-    Args:
-        target: Target dict (modified in place).
-        source: Source dict.
-        strategy: Conflict resolution strategy.
-        source_name: Display name of the source callback (used by
-            ``dict_merge`` strategy).
-
-    Raises:
-        KeyConflictError: When strategy is ``raise`` and keys overlap.
-    """
+
+def _merge_list(target: dict[str, Any], source: dict[str, Any], _name: str) -> None:
+    """``list_merge``: collect every value for a key into a list."""
     for key, value in source.items():
         if key in target:
-            target[key] = _resolve_conflict(
-                strategy, key, target[key], value, source_name
-            )
+            target[key].append(value)
         else:
-            target[key] = _wrap_value(strategy, value, source_name)
+            target[key] = [value]
+
+
+def _merge_by_name(
+    target: dict[str, Any], source: dict[str, Any], source_name: str
+) -> None:
+    """``dict_merge``: collect values for a key keyed by callback name."""
+    for key, value in source.items():
+        if key in target:
+            target[key][source_name] = value
+        else:
+            target[key] = {source_name: value}
+
+
+MERGERS: dict[MergeStrategy, Merger] = {
+    "raise": _merge_raise,
+    "keep": _merge_keep,
+    "override": _merge_override,
+    "list_merge": _merge_list,
+    "dict_merge": _merge_by_name,
+}
+"""Merge function for each :data:`MergeStrategy`.
+
+Dispatchers look the merger up once per emit and call it directly for
+every callback result, instead of re-branching on the strategy per key.
+"""
@@ -96,6 +96,23 @@ class TestAffairAwareBasic:
         with pytest.raises(TypeError, match="requires async callbacks"):
             Handler(dispatcher=d)
 
+    def test_mode_mismatch_message_survives_rebound_method(self):
+        d = Dispatcher()
+
+        def sync_handle(affair: Ping) -> dict[str, str]:
+            return {"ok": affair.msg}
+
+        class Handler(AffairAware):
+            def __init__(self):
+                vars(self)["handle"] = sync_handle
+
+            @listen(Ping)
+            async def handle(self, affair: Ping) -> dict[str, str]:
+                return {"ok": affair.msg}
+
+        with pytest.raises(TypeError, match="is async, but Dispatcher requires sync"):
+            Handler(dispatcher=d)
+
 
 class TestAffairAwareAfterDeps:
     def test_after_between_methods(self):
@@ -173,6 +190,70 @@ class TestAffairAwareInheritance:
         result = d.emit(Ping(msg="hi"))
         assert result == {"h1": "hi", "h2": "hi"}
 
+    def test_cooperates_with_init_subclass_mixin(self):
+        d = Dispatcher()
+
+        class Tagged:
+            def __init_subclass__(cls, tag: str = "", **kwargs):
+                super().__init_subclass__(**kwargs)
+                cls.tag = tag
+
+        class Handler(AffairAware, Tagged, tag="mixin"):
+            @listen(Ping)
+            def handle(self, affair: Ping) -> dict[str, str]:
+                return {type(self).tag: affair.msg}
+
+        Handler(dispatcher=d)
+        assert d.emit(Ping(msg="hi")) == {"mixin": "hi"}
+
+    def test_slotted_subclass_has_no_instance_dict(self):
+        d = Dispatcher()
+
+        class Handler(AffairAware):
+            __slots__ = ("tag", "_affair_registrations")
+
+            def __init__(self, tag: str):
+                self.tag = tag
+
+            @listen(Ping)
+            def handle(self, affair: Ping) -> dict[str, str]:
+                return {self.tag: affair.msg}
+
+        h = Handler("slot", dispatcher=d)
+        assert not hasattr(h, "__dict__")
+        assert d.emit(Ping(msg="hi")) == {"slot": "hi"}
+        h.unregister()
+        assert d.emit(Ping(msg="hi")) == {}
+
+    def test_mixes_with_builtin_base(self):
+        d = Dispatcher()
+
+        class Handler(AffairAware, dict):
+            @listen(Ping)
+            def handle(self, affair: Ping) -> dict[str, str]:
+                return {"builtin": affair.msg}
+
+        h = Handler(dispatcher=d)
+        assert h == {}
+        assert d.emit(Ping(msg="hi")) == {"builtin": "hi"}
+
+    def test_mixes_with_slotted_base(self):
+        d = Dispatcher()
+
+        class Base:
+            __slots__ = ("tag",)
+
+        class Handler(AffairAware, Base):
+            def __init__(self, tag: str):
+                self.tag = tag
+
+            @listen(Ping)
+            def handle(self, affair: Ping) -> dict[str, str]:
+                return {self.tag: affair.msg}
+
+        Handler("slotted", dispatcher=d)
+        assert d.emit(Ping(msg="hi")) == {"slotted": "hi"}
+
 
 class TestAffairAwareStaticAndClassMethod:
     def test_staticmethod_registered_on_instantiation(self):
@@ -25,3 +25,11 @@ class TestAffair:
         e = Ping(msg="hi")
         with pytest.raises(ValidationError):
             e.msg = "bye"  # type: ignore[misc]
+
+    def test_unchecked_skips_validation(self):
+        """_unchecked builds instances without validation but stays frozen."""
+        e = Ping._unchecked(msg=1)
+        assert e.msg == 1
+        assert e.emit_up is False
+        with pytest.raises(ValidationError):
+            e.msg = "bye"  # type: ignore[misc]
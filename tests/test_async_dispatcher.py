@@ -1,11 +1,16 @@
 """Tests for AsyncDispatcher."""
 
+from contextvars import ContextVar
+from typing import Any
+
 import pytest
 from conftest import ChildAffair, GrandchildAffair, MutablePing, ParentAffair, Ping
 
 from affairon import CallbackErrorAffair, KeyConflictError, MutableAffair
 from affairon.async_dispatcher import AsyncDispatcher
 
+_request_id: ContextVar[str] = ContextVar("request_id", default="unset")
+
 
 class TestAsyncDispatcher:
     @pytest.mark.asyncio
@@ -24,6 +29,30 @@ class TestAsyncDispatcher:
         result = await d.emit(Ping(msg="x"))
         assert result == {"a": 1, "b": 2}
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("listeners", [1, 2])
+    async def test_listener_context_changes_do_not_leak(self, listeners: int):
+        """ContextVars set by listeners stay isolated, however many fire."""
+        d = AsyncDispatcher()
+        seen: list[str] = []
+        setters = []
+
+        for i in range(listeners):
+
+            async def setter(e: MutableAffair, i: int = i) -> None:
+                _request_id.set(f"listener-{i}")
+
+            d.register(Ping, setter)
+            setters.append(setter)
+
+        @d.on(Ping, after=setters)
+        async def reader(e: MutableAffair) -> None:
+            seen.append(_request_id.get())
+
+        await d.emit(Ping(msg="x"))
+        assert seen == ["unset"]
+        assert _request_id.get() == "unset"
+
     @pytest.mark.asyncio
     async def test_emit_exception_group(self):
         """Failing listeners propagate ExceptionGroup."""
@@ -210,6 +239,22 @@ class TestAsyncWhenFilter:
         await d.emit(Ping(msg="go"))
         assert called == [1]
 
+    @pytest.mark.asyncio
+    async def test_when_filtered_layer_failure_still_grouped(self):
+        """A layer filtered down to one failing callback raises ExceptionGroup."""
+        d = AsyncDispatcher()
+
+        @d.on(Ping, when=lambda a: a.msg == "never")
+        async def skipped(affair: Ping) -> None: ...
+
+        @d.on(Ping)
+        async def bad(affair: Ping) -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ExceptionGroup) as exc_info:
+            await d.emit(Ping(msg="x"))
+        assert len(exc_info.value.exceptions) == 1
+
     @pytest.mark.asyncio
     async def test_when_with_emit_up(self):
         """Async when predicate checked per-affair-type during emit_up."""
@@ -285,6 +330,24 @@ class TestAsyncCallbackErrorHandling:
         assert result == {"attempt": 2}
         assert call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_no_handler_skips_error_affair(self, monkeypatch):
+        """Without error handlers no CallbackErrorAffair is built."""
+        d = AsyncDispatcher()
+
+        @d.on(MutablePing)
+        async def bad(affair: MutablePing) -> None:
+            raise ValueError("boom")
+
+        def fail(**_data):
+            raise AssertionError("CallbackErrorAffair built")
+
+        monkeypatch.setattr(CallbackErrorAffair, "_unchecked", fail)
+
+        with pytest.raises(ExceptionGroup) as exc_info:
+            await d.emit(MutablePing(msg="x"))
+        assert [type(e) for e in exc_info.value.exceptions] == [ValueError]
+
     @pytest.mark.asyncio
     async def test_retry_exhausted_reraises(self):
         """All retries fail → exception re-raised (surfaces as ExceptionGroup)."""
@@ -301,6 +364,28 @@ class TestAsyncCallbackErrorHandling:
         with pytest.raises(ExceptionGroup):
             await d.emit(MutablePing(msg="x"))
 
+    @pytest.mark.asyncio
+    async def test_retry_backoff_awaits_between_attempts(self, monkeypatch):
+        """retry_backoff awaits asyncio.sleep before each retry, doubling."""
+        d = AsyncDispatcher()
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr("affairon.async_dispatcher.asyncio.sleep", fake_sleep)
+
+        @d.on(MutablePing)
+        async def bad(affair: MutablePing) -> None:
+            raise RuntimeError("fail")
+
+        @d.on(CallbackErrorAffair)
+        async def handler(affair: CallbackErrorAffair) -> dict[str, Any]:
+            return {"retry": 2, "retry_backoff": 0.25, "silent": True}
+
+        assert await d.emit(MutablePing(msg="x")) == {}
+        assert sleeps == [0.25, 0.5]
+
     @pytest.mark.asyncio
     async def test_retry_exhausted_then_silent(self):
         """All retries fail + silent=True → swallow error."""
@@ -4,10 +4,16 @@ from typing import Any
 
 import pytest
 from conftest import Ping
+from packaging.requirements import Requirement
 
 from affairon import Dispatcher, listen
 from affairon.composer import PluginComposer
-from affairon.exceptions import PluginConfigError, PluginTargetError
+from affairon.exceptions import (
+    PluginConfigError,
+    PluginEntryPointError,
+    PluginTargetError,
+    PluginVersionError,
+)
 
 
 def _unregistered_dependency(affair):
@@ -31,7 +37,7 @@ class TestPluginComposer:
             __name__="fake_plugin.lib", external_listener=external_listener
         )
         dist = SimpleNamespace(version="1.2.0")
-        ep = SimpleNamespace(value="fake_plugin.lib:any_symbol")
+        ep = SimpleNamespace(name="fake-plugin", value="fake_plugin.lib:any_symbol")
 
         monkeypatch.setattr(
             "affairon.composer.importlib.metadata.distribution",
@@ -64,6 +70,84 @@ class TestPluginComposer:
         assert after is None
         assert when is None
 
+    def test_missing_entry_point_raises_after_single_scan(self, monkeypatch):
+        composer = PluginComposer(Dispatcher())
+        scans: list[dict[str, Any]] = []
+
+        def fake_entry_points(**kwargs):
+            scans.append(kwargs)
+            return [SimpleNamespace(name="other-plugin", value="other:any")]
+
+        monkeypatch.setattr(
+            "affairon.composer.importlib.metadata.distribution",
+            lambda _name: SimpleNamespace(version="1.0"),
+        )
+        monkeypatch.setattr(
+            "affairon.composer.importlib.metadata.entry_points", fake_entry_points
+        )
+
+        with pytest.raises(PluginEntryPointError, match="fake-plugin"):
+            composer.compose(["fake-plugin"])
+        assert scans == [{"group": "affairon.plugins"}]
+
+    def test_repeated_requirement_is_checked_and_loaded_once(
+        self, monkeypatch, tmp_path: Path
+    ):
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            "\n".join(
+                [
+                    "[tool.affairon]",
+                    'plugins = ["fake-plugin>=1.0", "ext>=2.0", "fake-plugin>=1.0"]',
+                ]
+            ),
+            encoding="utf-8",
+        )
+        composer = PluginComposer(Dispatcher())
+        parsed: list[str] = []
+        imports: list[str] = []
+
+        def spy_requirement(req_str: str) -> Requirement:
+            parsed.append(req_str)
+            return Requirement(req_str)
+
+        def fake_import(name):
+            imports.append(name)
+            return SimpleNamespace(__name__=name)
+
+        monkeypatch.setattr("affairon.composer.Requirement", spy_requirement)
+        monkeypatch.setattr(
+            "affairon.composer.importlib.metadata.distribution",
+            lambda _name: SimpleNamespace(version="2.0"),
+        )
+        monkeypatch.setattr(
+            "affairon.composer.importlib.metadata.entry_points",
+            lambda **_kwargs: [
+                SimpleNamespace(name="fake-plugin", value="fake_plugin.lib:any"),
+                SimpleNamespace(name="ext", value="ext.lib:any"),
+            ],
+        )
+        monkeypatch.setattr("affairon.composer.importlib.import_module", fake_import)
+
+        composer.compose_from_pyproject(pyproject)
+
+        assert parsed == ["fake-plugin>=1.0", "ext>=2.0"]
+        assert imports == ["fake_plugin.lib", "ext.lib"]
+
+    def test_unsatisfied_version_specifier_raises(self, monkeypatch):
+        composer = PluginComposer(Dispatcher())
+
+        monkeypatch.setattr(
+            "affairon.composer.importlib.metadata.distribution",
+            lambda _name: SimpleNamespace(version="1.0"),
+        )
+        monkeypatch.setattr(
+            "affairon.composer.importlib.metadata.entry_points", lambda **_kwargs: []
+        )
+
+        with pytest.raises(PluginVersionError, match="does not satisfy"):
+            composer.compose(["fake-plugin>=2.0"])
+
     def test_local_plugin_target_must_be_module_path(self):
         composer = PluginComposer(Dispatcher())
 
@@ -186,6 +270,12 @@ class TestPluginComposer:
         with pytest.raises(PluginConfigError, match=match):
             composer.compose_from_pyproject(pyproject, profile="kernel")
 
+    def test_compose_from_pyproject_raises_for_missing_file(self, tmp_path: Path):
+        composer = PluginComposer(Dispatcher())
+
+        with pytest.raises(PluginConfigError, match="Failed to read pyproject"):
+            composer.compose_from_pyproject(tmp_path / "pyproject.toml")
+
     def test_compose_from_pyproject_raises_for_invalid_toml(self, tmp_path: Path):
         pyproject = tmp_path / "pyproject.toml"
         pyproject.write_text("[tool.affairon\n", encoding="utf-8")
@@ -195,6 +285,17 @@ class TestPluginComposer:
         with pytest.raises(PluginConfigError, match="Failed to parse pyproject"):
             composer.compose_from_pyproject(pyproject)
 
+    def test_compose_from_pyproject_raises_for_invalid_toml_without_affairon(
+        self, tmp_path: Path
+    ):
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project\nname = "app"\n', encoding="utf-8")
+
+        composer = PluginComposer(Dispatcher())
+
+        with pytest.raises(PluginConfigError, match="Failed to parse pyproject"):
+            composer.compose_from_pyproject(pyproject)
+
     def test_compose_from_pyproject_empty_profile_is_noop(
         self,
         monkeypatch,
@@ -226,6 +327,30 @@ class TestPluginComposer:
 
         assert events == []
 
+    def test_compose_from_pyproject_without_affairon_is_noop(
+        self,
+        monkeypatch,
+        tmp_path: Path,
+    ):
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "app"\n', encoding="utf-8")
+
+        composer = PluginComposer(Dispatcher())
+        events: list[str] = []
+
+        monkeypatch.setattr(
+            composer, "compose", lambda reqs: events.append(f"ext:{reqs}")
+        )
+        monkeypatch.setattr(
+            composer,
+            "compose_local",
+            lambda targets: events.append(f"local:{targets}"),
+        )
+
+        composer.compose_from_pyproject(pyproject)
+
+        assert events == []
+
     def test_only_module_defined_functions_are_auto_registered(self, monkeypatch):
         dispatcher = Dispatcher()
         composer = PluginComposer(dispatcher)
@@ -226,6 +226,22 @@ class TestCallbackErrorHandling:
         with pytest.raises(ValueError, match="boom"):
             d.emit(MutablePing(msg="x"))
 
+    def test_no_handler_skips_error_affair(self, monkeypatch):
+        """Without error handlers no CallbackErrorAffair is built."""
+        d = Dispatcher()
+
+        @d.on(MutablePing)
+        def bad(affair: MutablePing) -> None:
+            raise ValueError("boom")
+
+        def fail(**_data):
+            raise AssertionError("CallbackErrorAffair built")
+
+        monkeypatch.setattr(CallbackErrorAffair, "_unchecked", fail)
+
+        with pytest.raises(ValueError, match="boom"):
+            d.emit(MutablePing(msg="x"))
+
     def test_silent_swallows_error(self):
         """Error handler returning silent=True swallows the exception."""
         d = Dispatcher()
@@ -369,6 +385,37 @@ class TestCallbackErrorHandling:
         result = d.emit(MutablePing(msg="x"))
         assert result == {"attempt": 2}
 
+    def test_retry_backoff_doubles_between_attempts(self, monkeypatch):
+        """retry_backoff sleeps before each retry, doubling every attempt."""
+        d = Dispatcher()
+        sleeps: list[float] = []
+        monkeypatch.setattr("affairon.dispatcher.time.sleep", sleeps.append)
+
+        @d.on(MutablePing)
+        def bad(affair: MutablePing) -> None:
+            raise RuntimeError("fail")
+
+        d.register(
+            CallbackErrorAffair,
+            lambda e: {"retry": 3, "retry_backoff": 0.5, "silent": True},
+        )
+
+        assert d.emit(MutablePing(msg="x")) == {}
+        assert sleeps == [0.5, 1.0, 2.0]
+
+    def test_invalid_retry_backoff_raises_type_error(self):
+        """Non-float-convertible retry_backoff raises TypeError."""
+        d = Dispatcher()
+
+        @d.on(MutablePing)
+        def bad(affair: MutablePing) -> None:
+            raise ValueError("x")
+
+        d.register(CallbackErrorAffair, lambda e: {"retry": 1, "retry_backoff": "soon"})
+
+        with pytest.raises(TypeError, match="retry_backoff"):
+            d.emit(MutablePing(msg="x"))
+
 
 class TestMergeStrategyRaise:
     def test_raise_is_default(self):
@@ -1,4 +1,10 @@
+import asyncio
+import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
 
 from affairon.fairun import cli
 
@@ -76,3 +82,91 @@ def test_main_async_uses_same_dispatcher_for_compose_and_emit(
     assert events[0] == f"composer:{dispatcher_id}"
     assert events[1] == f"compose:pyproject.toml:{dispatcher_id}"
     assert events[2] == f"emit:{dispatcher_id}:{tmp_path.resolve()}:{dispatcher_id}"
+
+
+def test_main_async_runs_on_selected_loop_factory(monkeypatch, tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text("[tool.affairon]\n", encoding="utf-8")
+    created: list[asyncio.AbstractEventLoop] = []
+
+    def loop_factory() -> asyncio.AbstractEventLoop:
+        loop = asyncio.new_event_loop()
+        created.append(loop)
+        return loop
+
+    class _FakeAsyncDispatcher:
+        async def emit(self, affair) -> None:
+            assert asyncio.get_running_loop() is created[0]
+
+    monkeypatch.setattr(cli, "default_async_dispatcher", _FakeAsyncDispatcher())
+    monkeypatch.setattr(cli, "PluginComposer", lambda d: _DummyComposer(d, []))
+    requested: list[bool] = []
+
+    def select_loop_factory(use_uvloop: bool):
+        requested.append(use_uvloop)
+        return loop_factory
+
+    monkeypatch.setattr(cli, "_loop_factory", select_loop_factory)
+
+    cli.main(["--async", "--uvloop", str(tmp_path)])
+
+    assert requested == [True]
+    assert len(created) == 1
+
+
+def test_main_exits_before_composing_when_uvloop_missing(monkeypatch, tmp_path: Path):
+    (tmp_path / "pyproject.toml").write_text("[tool.affairon]\n", encoding="utf-8")
+    events: list[str] = []
+    created: list[Any] = []
+
+    class _FakeAsyncDispatcher:
+        def emit(self, affair):
+            coro = asyncio.sleep(0)
+            created.append(coro)
+            return coro
+
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    monkeypatch.setattr(cli, "default_async_dispatcher", _FakeAsyncDispatcher())
+    monkeypatch.setattr(cli, "PluginComposer", lambda d: _DummyComposer(d, events))
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main(["--async", "--uvloop", str(tmp_path)])
+
+    assert exc_info.value.code == 1
+    assert events == []
+    assert created == []
+
+
+def test_main_rejects_uvloop_without_async(monkeypatch, tmp_path: Path, capsys):
+    (tmp_path / "pyproject.toml").write_text("[tool.affairon]\n", encoding="utf-8")
+    events: list[str] = []
+    monkeypatch.setattr(cli, "PluginComposer", lambda d: _DummyComposer(d, events))
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main(["--uvloop", str(tmp_path)])
+
+    assert exc_info.value.code == 2
+    assert "--uvloop requires --async" in capsys.readouterr().err
+    assert events == []
+
+
+def test_loop_factory_defaults_to_stock_loop():
+    assert cli._loop_factory(False) is None
+
+
+def test_loop_factory_returns_uvloop_constructor(monkeypatch):
+    def new_event_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.new_event_loop()
+
+    monkeypatch.setitem(
+        sys.modules, "uvloop", SimpleNamespace(new_event_loop=new_event_loop)
+    )
+
+    assert cli._loop_factory(True) is new_event_loop
+
+
+def test_loop_factory_exits_when_uvloop_missing(monkeypatch):
+    # A None entry makes `import uvloop` raise ImportError.
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    with pytest.raises(SystemExit):
+        cli._loop_factory(True)
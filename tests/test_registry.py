@@ -1,16 +1,17 @@
 """Tests for BaseRegistry dependency graph behavior."""
 
 import pytest
-from conftest import Ping
+from conftest import Ping, Pong
 
 from affairon import Dispatcher, MutableAffair
 from affairon.exceptions import CyclicDependencyError
+from affairon.utils import callable_name
 
 
 class TestRegistry:
     @staticmethod
     def _make():
-        """Return a fresh registry backed by a real Dispatcher guardian."""
+        """Return a fresh registry owned by a real Dispatcher."""
         return Dispatcher()._registry
 
     def test_after_ordering(self):
@@ -45,8 +46,34 @@ class TestRegistry:
 
         reg.add([Ping], a)
         reg.add([Ping], b, after=[a])
-        with pytest.raises(CyclicDependencyError):
+        with pytest.raises(CyclicDependencyError, match=r"a -> .*b -> .*a$"):
             reg.add([Ping], a, after=[b])
+        assert reg.exec_order(Ping) == ((a,), (b,))
+
+    def test_dependent_layers_after_all_dependencies(self):
+        """A callback never shares a layer with any of its dependencies."""
+        reg = self._make()
+
+        def a(e: MutableAffair) -> None: ...
+        def b(e: MutableAffair) -> None: ...
+        def c(e: MutableAffair) -> None: ...
+
+        reg.add([Ping], a)
+        reg.add([Ping], b, after=[a])
+        reg.add([Ping], c, after=[a, b])
+        assert reg.exec_order(Ping) == ((a,), (b,), (c,))
+
+    def test_dependents_survive_removed_dependency(self):
+        """Removing a callback drops its edges but keeps its dependents."""
+        reg = self._make()
+
+        def a(e: MutableAffair) -> None: ...
+        def b(e: MutableAffair) -> None: ...
+
+        reg.add([Ping], a)
+        reg.add([Ping], b, after=[a])
+        reg.remove([Ping], a)
+        assert reg.exec_order(Ping) == ((b,),)
 
     def test_remove_excludes_callback(self):
         """Removed callback no longer in exec_order."""
@@ -58,3 +85,71 @@ class TestRegistry:
         reg.remove([Ping], a)
         flat = [cb for layer in reg.exec_order(Ping) for cb in layer]
         assert a not in flat
+
+    def test_exec_order_cache_invalidated_on_change(self):
+        """Cached exec_order reflects later add/remove calls."""
+        reg = self._make()
+
+        def a(e: MutableAffair) -> None: ...
+        def b(e: MutableAffair) -> None: ...
+
+        reg.add([Ping], a)
+        assert reg.exec_order(Ping) is reg.exec_order(Ping)
+        reg.add([Ping], b, after=[a])
+        assert reg.exec_order(Ping) == ((a,), (b,))
+        reg.remove(None, a)
+        flat = [cb for layer in reg.exec_order(Ping) for cb in layer]
+        assert a not in flat
+
+    def test_has_listeners_tracks_registration(self):
+        """has_listeners flips with the first add and the last remove."""
+        reg = self._make()
+
+        def a(e: MutableAffair) -> None: ...
+
+        assert not reg.has_listeners(Ping)
+        reg.add([Ping], a)
+        assert reg.has_listeners(Ping)
+        reg.remove([Ping], None)
+        assert not reg.has_listeners(Ping)
+
+    def test_exec_plan_pairs_callbacks_with_names(self):
+        """exec_plan mirrors exec_order with registration-time names."""
+        reg = self._make()
+
+        def a(e: MutableAffair) -> None: ...
+        def b(e: MutableAffair) -> None: ...
+
+        reg.add([Ping], a)
+        reg.add([Ping], b, after=[a])
+        plan = reg.exec_plan(Ping)
+        assert tuple(tuple(cb for cb, _, _ in layer) for layer in plan) == (
+            reg.exec_order(Ping)
+        )
+        for layer in plan:
+            for cb, name, _ in layer:
+                assert name == callable_name(cb)
+
+    def test_walk_plan_concatenates_and_invalidates(self):
+        """walk_plan chains per-type plans and drops stale entries on add."""
+        reg = self._make()
+
+        def a(e: MutableAffair) -> None: ...
+        def b(e: MutableAffair) -> None: ...
+
+        reg.add([Ping], a)
+        assert reg.walk_plan((Ping, Pong)) == reg.exec_plan(Ping)
+        reg.add([Pong], b)
+        assert reg.walk_plan((Ping, Pong)) == reg.exec_plan(Ping) + reg.exec_plan(Pong)
+
+    def test_flat_plan_drops_layers_and_invalidates(self):
+        """flat_plan keeps walk order without layer tuples."""
+        reg = self._make()
+
+        def a(e: MutableAffair) -> None: ...
+        def b(e: MutableAffair) -> None: ...
+
+        reg.add([Ping], a)
+        assert [cb for cb, _, _ in reg.flat_plan((Ping,))] == [a]
+        reg.add([Ping], b, after=[a])
+        assert [cb for cb, _, _ in reg.flat_plan((Ping,))] == [a, b]
@@ -0,0 +1,25 @@
+"""Tests for affairon.utils helpers."""
+
+import pytest
+from packaging.utils import canonicalize_name
+
+from affairon.utils import normalize_name
+
+
+class TestNormalizeName:
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "my-plugin",
+            "my_plugin",
+            "my.plugin",
+            "My-Plugin",
+            "MY_Plugin.Ext",
+            "a--b",
+            "a_.b",
+            "a-_-.b",
+        ],
+    )
+    def test_matches_pep_503(self, name: str):
+        """Fast path and regex path both agree with PEP 503."""
+        assert normalize_name(name) == canonicalize_name(name)